@@ -1,13 +1,39 @@
 """Entry point for the TestRail MCP server when run as a module."""
 import sys
 import asyncio
+import argparse
 
 from testrail_mcp.mcp_server import TestRailMCPServer
+from testrail_mcp.config import (
+    TESTRAIL_MCP_PROFILE_DIR, TESTRAIL_MCP_PROFILE_THRESHOLD_MS, TESTRAIL_MCP_PROFILE_MAX_FILES,
+)
 
 def main():
     """Run the TestRail MCP server."""
+    parser = argparse.ArgumentParser(prog="testrail-mcp", description="TestRail MCP server")
+    parser.add_argument(
+        "--profile-dir",
+        default=TESTRAIL_MCP_PROFILE_DIR,
+        help="Write a cProfile file per slow tool/resource call to this directory",
+    )
+    parser.add_argument(
+        "--profile-threshold-ms",
+        type=float,
+        default=TESTRAIL_MCP_PROFILE_THRESHOLD_MS,
+        help="Only keep profiles of calls taking at least this many milliseconds",
+    )
+    parser.add_argument(
+        "--profile-max-files",
+        type=int,
+        default=TESTRAIL_MCP_PROFILE_MAX_FILES,
+        help="Number of profiles kept in the profile directory; the oldest are deleted first",
+    )
+    args, _ = parser.parse_known_args()
+
     print("Starting TestRail MCP server in stdio mode", file=sys.stderr)
-    server = TestRailMCPServer()
+    if args.profile_dir:
+        print(f"Profiling handlers to {args.profile_dir}", file=sys.stderr)
+    server = TestRailMCPServer(args.profile_dir, args.profile_threshold_ms, args.profile_max_files)
     asyncio.run(server.run_stdio_async())
 
 if __name__ == "__main__":
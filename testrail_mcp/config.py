@@ -15,4 +15,25 @@ if not all([TESTRAIL_URL, TESTRAIL_USERNAME, TESTRAIL_API_KEY]):
     raise ValueError(
         "Missing TestRail configuration. Please set TESTRAIL_URL, "
         "TESTRAIL_USERNAME, and TESTRAIL_API_KEY environment variables."
-    )
\ No newline at end of file
+    )
+
+# Optional profiling of tool and resource handlers
+TESTRAIL_MCP_PROFILE_DIR = os.getenv('TESTRAIL_MCP_PROFILE_DIR')
+TESTRAIL_MCP_PROFILE_THRESHOLD_MS = float(os.getenv('TESTRAIL_MCP_PROFILE_THRESHOLD_MS', '1000'))
+TESTRAIL_MCP_PROFILE_MAX_FILES = int(os.getenv('TESTRAIL_MCP_PROFILE_MAX_FILES', '100'))
+
+# Seconds a cached section tree is used before it is rebuilt
+TESTRAIL_SECTION_CACHE_TTL = float(os.getenv('TESTRAIL_SECTION_CACHE_TTL', '300'))
+
+# Share of a suite's sections above which a subtree's cases are fetched with one
+# suite-wide request instead of one request per section
+TESTRAIL_SECTION_SUITE_FETCH_RATIO = float(os.getenv('TESTRAIL_SECTION_SUITE_FETCH_RATIO', '0.5'))
+
+# Request timeout, hedged GETs and circuit breaker
+TESTRAIL_TIMEOUT = float(os.getenv('TESTRAIL_TIMEOUT', '30'))
+TESTRAIL_HEDGE_GETS = os.getenv('TESTRAIL_HEDGE_GETS', 'false').lower() in ('1', 'true', 'yes')
+TESTRAIL_HEDGE_PERCENTILE = float(os.getenv('TESTRAIL_HEDGE_PERCENTILE', '95'))
+TESTRAIL_HEDGE_MIN_DELAY_MS = float(os.getenv('TESTRAIL_HEDGE_MIN_DELAY_MS', '50'))
+TESTRAIL_HEDGE_BUDGET_PERCENT = float(os.getenv('TESTRAIL_HEDGE_BUDGET_PERCENT', '10'))
+TESTRAIL_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('TESTRAIL_CIRCUIT_FAILURE_THRESHOLD', '5'))
+TESTRAIL_CIRCUIT_RESET_SECONDS = float(os.getenv('TESTRAIL_CIRCUIT_RESET_SECONDS', '30'))
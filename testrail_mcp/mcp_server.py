@@ -2,20 +2,85 @@
 from typing import Dict, List, Any, Optional, Union
 from fastmcp import FastMCP
 
-from testrail_mcp.testrail_client import TestRailClient
-from testrail_mcp.config import TESTRAIL_URL, TESTRAIL_USERNAME, TESTRAIL_API_KEY
+from testrail_mcp.testrail_client import TestRailClient, BULK_CHUNK_SIZE
+from testrail_mcp.config import (
+    TESTRAIL_URL, TESTRAIL_USERNAME, TESTRAIL_API_KEY,
+    TESTRAIL_MCP_PROFILE_DIR, TESTRAIL_MCP_PROFILE_THRESHOLD_MS, TESTRAIL_MCP_PROFILE_MAX_FILES,
+    TESTRAIL_TIMEOUT, TESTRAIL_HEDGE_GETS, TESTRAIL_HEDGE_PERCENTILE,
+    TESTRAIL_HEDGE_MIN_DELAY_MS, TESTRAIL_HEDGE_BUDGET_PERCENT, TESTRAIL_CIRCUIT_FAILURE_THRESHOLD,
+    TESTRAIL_CIRCUIT_RESET_SECONDS, TESTRAIL_SECTION_CACHE_TTL,
+    TESTRAIL_SECTION_SUITE_FETCH_RATIO,
+)
+from testrail_mcp.profiling import HandlerProfiler
+
+
+def _summarize_bulk(chunks: List[Dict]) -> Dict:
+    """Summarize the per-chunk outcomes of a bulk case operation."""
+    counts = {'succeeded': 0, 'failed': 0, 'not_attempted': 0}
+    for chunk in chunks:
+        counts[chunk['status']] += chunk['case_count']
+    return {
+        'total_cases': sum(counts.values()),
+        'succeeded_cases': counts['succeeded'],
+        'failed_cases': counts['failed'],
+        'not_attempted_cases': counts['not_attempted'],
+        'chunks': chunks,
+    }
 
 
 class TestRailMCPServer(FastMCP):
     """MCP server for TestRail integration using FastMCP."""
     
-    def __init__(self):
-        """Initialize the TestRail MCP server."""
+    def __init__(
+        self,
+        profile_dir: Optional[str] = TESTRAIL_MCP_PROFILE_DIR,
+        profile_threshold_ms: float = TESTRAIL_MCP_PROFILE_THRESHOLD_MS,
+        profile_max_files: int = TESTRAIL_MCP_PROFILE_MAX_FILES
+    ):
+        """
+        Initialize the TestRail MCP server.
+        
+        Args:
+            profile_dir: Directory for call profiles; profiling is off when not set
+            profile_threshold_ms: Only keep profiles of calls at least this slow
+            profile_max_files: Number of profiles kept in the profile directory
+        """
         super().__init__(name="TestRail MCP Server", version="0.1.3")
-        self.client = TestRailClient(TESTRAIL_URL, TESTRAIL_USERNAME, TESTRAIL_API_KEY)
+        self.client = TestRailClient(
+            TESTRAIL_URL, TESTRAIL_USERNAME, TESTRAIL_API_KEY,
+            timeout=TESTRAIL_TIMEOUT,
+            hedge_gets=TESTRAIL_HEDGE_GETS,
+            hedge_percentile=TESTRAIL_HEDGE_PERCENTILE,
+            hedge_min_delay=TESTRAIL_HEDGE_MIN_DELAY_MS / 1000,
+            hedge_budget=TESTRAIL_HEDGE_BUDGET_PERCENT / 100,
+            circuit_failure_threshold=TESTRAIL_CIRCUIT_FAILURE_THRESHOLD,
+            circuit_reset_seconds=TESTRAIL_CIRCUIT_RESET_SECONDS,
+            section_cache_ttl=TESTRAIL_SECTION_CACHE_TTL,
+            section_suite_fetch_ratio=TESTRAIL_SECTION_SUITE_FETCH_RATIO,
+        )
+        self.handler_profiler = (
+            HandlerProfiler(profile_dir, profile_threshold_ms, profile_max_files)
+            if profile_dir else None
+        )
+        if self.handler_profiler is not None:
+            self.add_middleware(self.handler_profiler)
         self._register_tools()
         self._register_resources()
     
+    def tool(self, *args, **kwargs):
+        """Register a tool, timing its handler when profiling is enabled."""
+        return self._profiled(super().tool(*args, **kwargs))
+    
+    def resource(self, *args, **kwargs):
+        """Register a resource, timing its handler when profiling is enabled."""
+        return self._profiled(super().resource(*args, **kwargs))
+    
+    def _profiled(self, decorator):
+        """Apply the handler profiler before handing a function to a FastMCP decorator."""
+        if self.handler_profiler is None:
+            return decorator
+        return lambda fn: decorator(self.handler_profiler.wrap(fn))
+    
     def _register_tools(self):
         """Register all TestRail tools with the MCP server."""
         # Project tools
@@ -228,7 +293,106 @@ class TestRailMCPServer(FastMCP):
                 case_id: The ID of the test case
             """
             return self.client.delete_case(case_id)
-        
+
+        @self.tool("update_cases", description="Update multiple test cases of a suite with the same values")
+        def update_cases(
+            suite_id: int,
+            case_ids: List[int],
+            type_id: Optional[int] = None,
+            priority_id: Optional[int] = None,
+            estimate: Optional[str] = None,
+            milestone_id: Optional[int] = None,
+            refs: Optional[str] = None,
+            chunk_size: int = BULK_CHUNK_SIZE
+        ) -> Dict:
+            """
+            Update multiple test cases of a suite with the same values.
+
+            Args:
+                suite_id: The ID of the test suite
+                case_ids: The IDs of the test cases to update
+                type_id: The ID of the case type (optional)
+                priority_id: The ID of the priority (optional)
+                estimate: The estimate, e.g. '30s' or '1m 45s' (optional)
+                milestone_id: The ID of the milestone (optional)
+                refs: A comma-separated list of references (optional)
+                chunk_size: Maximum number of case IDs per request (default: 250)
+            """
+            data = {}
+            if type_id is not None:
+                data['type_id'] = type_id
+            if priority_id is not None:
+                data['priority_id'] = priority_id
+            if estimate is not None:
+                data['estimate'] = estimate
+            if milestone_id is not None:
+                data['milestone_id'] = milestone_id
+            if refs is not None:
+                data['refs'] = refs
+            chunks = self.client.update_cases(
+                suite_id, case_ids, data, chunk_size
+            )
+            return _summarize_bulk(chunks)
+
+        @self.tool("delete_cases", description="Delete multiple test cases of a suite")
+        def delete_cases(
+            suite_id: int,
+            case_ids: List[int],
+            chunk_size: int = BULK_CHUNK_SIZE
+        ) -> Dict:
+            """
+            Delete multiple test cases of a suite.
+
+            Args:
+                suite_id: The ID of the test suite
+                case_ids: The IDs of the test cases to delete
+                chunk_size: Maximum number of case IDs per request (default: 250)
+            """
+            chunks = self.client.delete_cases(
+                suite_id, case_ids, chunk_size
+            )
+            return _summarize_bulk(chunks)
+
+        @self.tool("get_cases_in_section", description="Get all test cases of a section, including its subsections by default")
+        def get_cases_in_section(
+            project_id: int,
+            section_id: int,
+            recursive: bool = True,
+            refresh: bool = False
+        ) -> List[Dict]:
+            """
+            Get all test cases of a section.
+
+            Args:
+                project_id: The ID of the project
+                section_id: The ID of the section
+                recursive: Whether to include cases of all subsections (default: true)
+                refresh: Whether to reload the cached section tree first (default: false)
+            """
+            return self.client.get_cases_in_section(project_id, section_id, recursive, refresh)
+
+        # Section tools
+        @self.tool("get_section", description="Get a section by ID")
+        def get_section(section_id: int) -> Dict:
+            """
+            Get a section by ID.
+
+            Args:
+                section_id: The ID of the section
+            """
+            return self.client.get_section(section_id)
+
+        @self.tool("get_sections", description="Get all sections for a project/suite")
+        def get_sections(project_id: int, suite_id: Optional[int] = None) -> List[Dict]:
+            """
+            Get all sections for a project/suite.
+
+            Args:
+                project_id: The ID of the project
+                suite_id: The ID of the test suite (optional)
+            """
+            return self.client.get_sections(project_id, suite_id)
+
         # Run tools
         @self.tool("get_run", description="Get a test run by ID")
         def get_run(run_id: int) -> Dict:
@@ -467,6 +631,12 @@ class TestRailMCPServer(FastMCP):
                 dataset_id: The ID of the dataset
             """
             return self.client.delete_dataset(dataset_id)
+        
+        # Client tools
+        @self.tool("get_client_metrics", description="Get TestRail request latency, hedging and circuit breaker metrics")
+        def get_client_metrics() -> Dict:
+            """Get TestRail request latency, hedging and circuit breaker metrics."""
+            return self.client.get_metrics()
     
     def _register_resources(self):
         """Register all TestRail resources with the MCP server."""
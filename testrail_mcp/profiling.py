@@ -0,0 +1,160 @@
+"""Opt-in profiling of MCP tool and resource calls."""
+import cProfile
+import functools
+import glob
+import inspect
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+# Before Python 3.12 cProfile only sees the thread that enabled it, so sync
+# handlers running on a worker thread need a profiler of their own
+_PER_THREAD_PROFILING = sys.version_info < (3, 12)
+
+# Function whose cumulative time is reported as time spent waiting on TestRail
+_TESTRAIL_REQUEST_FUNCTION = ('testrail_client.py', '_send_request')
+
+
+class _ProfiledCall:
+    """Timings and worker-thread profile collected for one profiled call."""
+
+    def __init__(self):
+        self.thread_id = threading.get_ident()
+        self.handler_ms: Optional[float] = None
+        self.handler_profile: Optional[cProfile.Profile] = None
+
+
+_current_call: ContextVar[Optional[_ProfiledCall]] = ContextVar('_current_call', default=None)
+
+
+class HandlerProfiler(Middleware):
+    """
+    Profiles tool and resource calls with cProfile.
+
+    The profile spans FastMCP's argument validation, the handler and result
+    serialization. Each call slower than the threshold writes a .prof file
+    and a .json file with its total, handler and TestRail request times.
+    """
+
+    def __init__(self, output_dir: str, threshold_ms: float = 1000.0, max_files: int = 100):
+        """
+        Initialize the profiler.
+
+        Args:
+            output_dir: Directory the profile files are written to
+            threshold_ms: Only keep profiles of calls taking at least this long
+            max_files: Number of profiles kept; the oldest are deleted first
+        """
+        self.output_dir = output_dir
+        self.threshold_ms = threshold_ms
+        self.max_files = max_files
+        os.makedirs(output_dir, exist_ok=True)
+        existing = sorted(glob.glob(os.path.join(output_dir, '*.prof')), key=os.path.getmtime)
+        self._written = deque(path[:-len('.prof')] for path in existing)
+        # cProfile allows only one active profiler, so concurrent calls run unprofiled
+        self._lock = threading.Lock()
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next) -> Any:
+        return await self._profile('tool', context.message.name, context, call_next)
+
+    async def on_read_resource(self, context: MiddlewareContext, call_next) -> Any:
+        return await self._profile('resource', str(context.message.uri), context, call_next)
+
+    async def _profile(self, kind: str, name: str, context: MiddlewareContext, call_next) -> Any:
+        """Run the rest of the middleware chain under the profiler."""
+        if not self._lock.acquire(blocking=False):
+            return await call_next(context)
+        call = _ProfiledCall()
+        token = _current_call.set(call)
+        profile = cProfile.Profile()
+        start = time.perf_counter()
+        try:
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler, e.g. a debugger, is already active
+                return await call_next(context)
+            try:
+                return await call_next(context)
+            finally:
+                profile.disable()
+                total_ms = (time.perf_counter() - start) * 1000
+                if total_ms >= self.threshold_ms:
+                    self._dump(profile, call, kind, name, total_ms)
+        finally:
+            _current_call.reset(token)
+            self._lock.release()
+
+    def wrap(self, fn: Callable) -> Callable:
+        """Wrap a synchronous handler to time it, and profile it when it runs on a worker thread."""
+        if inspect.iscoroutinefunction(fn):
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs) -> Any:
+            call = _current_call.get()
+            if call is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                if _PER_THREAD_PROFILING and threading.get_ident() != call.thread_id:
+                    call.handler_profile = cProfile.Profile()
+                    return call.handler_profile.runcall(fn, *args, **kwargs)
+                return fn(*args, **kwargs)
+            finally:
+                call.handler_ms = (time.perf_counter() - start) * 1000
+
+        return wrapper
+
+    def _dump(
+        self,
+        profile: cProfile.Profile,
+        call: _ProfiledCall,
+        kind: str,
+        name: str,
+        total_ms: float
+    ) -> None:
+        """Write the profile and its timings, then drop the oldest files beyond max_files."""
+        try:
+            stats = pstats.Stats(profile)
+            if call.handler_profile is not None:
+                stats.add(call.handler_profile)
+            testrail_ms = sum(
+                cumtime * 1000
+                for (filename, _, function), (_, _, _, cumtime, _) in stats.stats.items()
+                if filename.endswith(_TESTRAIL_REQUEST_FUNCTION[0])
+                and function == _TESTRAIL_REQUEST_FUNCTION[1]
+            )
+            safe_name = ''.join(c if c.isalnum() or c in '-_' else '_' for c in name)
+            base = os.path.join(
+                self.output_dir, f"{safe_name}-{time.time_ns()}-{total_ms:.0f}ms"
+            )
+            stats.dump_stats(base + '.prof')
+            with open(base + '.json', 'w') as f:
+                json.dump({
+                    'kind': kind,
+                    'name': name,
+                    'total_ms': round(total_ms, 1),
+                    'handler_ms': None if call.handler_ms is None else round(call.handler_ms, 1),
+                    'testrail_ms': round(testrail_ms, 1),
+                }, f)
+        except (OSError, TypeError) as e:
+            print(f"Failed to write profile for {name}: {e}", file=sys.stderr)
+            return
+
+        self._written.append(base)
+        while len(self._written) > self.max_files:
+            oldest = self._written.popleft()
+            for suffix in ('.prof', '.json'):
+                try:
+                    os.remove(oldest + suffix)
+                except OSError:
+                    pass
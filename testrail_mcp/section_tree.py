@@ -0,0 +1,72 @@
+"""In-memory index of the section hierarchy of a TestRail suite."""
+import time
+from typing import Dict, List, FrozenSet, Optional
+
+
+class SectionTree:
+    """Parent/child index of the sections of a single suite."""
+
+    def __init__(self, suite_id: int, sections: List[Dict]):
+        """
+        Build the index from the sections returned by get_sections.
+
+        Args:
+            suite_id: The ID of the test suite the sections belong to
+            sections: The sections of the suite
+        """
+        self.suite_id = suite_id
+        self.built_at = time.monotonic()
+        self.sections: Dict[int, Dict] = {s['id']: s for s in sections}
+        self.parents: Dict[int, Optional[int]] = {}
+        self.children: Dict[int, List[int]] = {section_id: [] for section_id in self.sections}
+        self.depths: Dict[int, int] = {}
+        self.descendants: Dict[int, FrozenSet[int]] = {}
+        # Section IDs in TestRail's tree order (pre-order by display_order)
+        self.order: List[int] = []
+        self._positions: Dict[int, int] = {}
+
+        roots = []
+        for section_id, section in self.sections.items():
+            parent_id = section.get('parent_id')
+            if parent_id not in self.sections:
+                parent_id = None
+            self.parents[section_id] = parent_id
+            if parent_id is None:
+                roots.append(section_id)
+            else:
+                self.children[parent_id].append(section_id)
+
+        def sort_key(section_id):
+            return (self.sections[section_id].get('display_order') or 0, section_id)
+
+        roots.sort(key=sort_key)
+        for child_ids in self.children.values():
+            child_ids.sort(key=sort_key)
+
+        # Walk top-down in pre-order to assign depths, then bottom-up to collect descendants
+        stack = [(section_id, 0) for section_id in reversed(roots)]
+        while stack:
+            section_id, depth = stack.pop()
+            self.depths[section_id] = depth
+            self._positions[section_id] = len(self.order)
+            self.order.append(section_id)
+            stack.extend((child_id, depth + 1) for child_id in reversed(self.children[section_id]))
+        for section_id in reversed(self.order):
+            subtree = {section_id}
+            for child_id in self.children[section_id]:
+                subtree |= self.descendants[child_id]
+            self.descendants[section_id] = frozenset(subtree)
+
+    def __contains__(self, section_id: int) -> bool:
+        return section_id in self.sections
+
+    def subtree(self, section_id: int) -> FrozenSet[int]:
+        """Get the IDs of a section and all of its descendants."""
+        if section_id not in self.sections:
+            raise KeyError(f"Section {section_id} not found in suite {self.suite_id}")
+        return self.descendants[section_id]
+
+    def ordered_subtree(self, section_id: int) -> List[int]:
+        """Get the IDs of a section and all of its descendants in tree order."""
+        start = self._positions[section_id]
+        return self.order[start:start + len(self.subtree(section_id))]
@@ -1,13 +1,62 @@
 """TestRail API client module."""
 import base64
 import json
-from typing import Dict, List, Any, Optional, Union
+import re
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, List, Any, Optional, Tuple, Union
 import requests
 
+from testrail_mcp.section_tree import SectionTree
+from testrail_mcp.resilience import CircuitBreaker, CircuitOpenError, LatencyTracker
+
+# Number of case IDs sent per bulk update/delete request
+BULK_CHUNK_SIZE = 250
+
+# Retries of a bulk chunk throttled with HTTP 429, the wait when no Retry-After
+# is given and the longest Retry-After honored, in seconds
+BULK_MAX_RETRIES = 3
+BULK_RETRY_DELAY = 1.0
+BULK_MAX_RETRY_DELAY = 60.0
+
+# Maximum number of concurrent GET requests on the hedging thread pool
+HEDGE_POOL_SIZE = 8
+
+def _api_method(uri: str) -> str:
+    """Get the API method of a URI, e.g. get_cases for get_cases/1&suite_id=2."""
+    return re.split(r'[/&]', uri, maxsplit=1)[0]
+
+def _to_ms(seconds: Optional[float]) -> Optional[float]:
+    """Convert seconds to rounded milliseconds, passing None through."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+class TestRailAPIError(Exception):
+    """Raised when TestRail answers a request with an error status."""
+
+    def __init__(self, status_code: int, error: Any, retry_after: Optional[float] = None):
+        super().__init__(f"TestRail API returned HTTP {status_code}: {error}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
 class TestRailClient:
     """TestRail API client for interacting with TestRail."""
 
-    def __init__(self, base_url: str, username: str, api_key: str):
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        api_key: str,
+        timeout: Optional[float] = None,
+        hedge_gets: bool = False,
+        hedge_percentile: float = 95.0,
+        hedge_min_delay: float = 0.05,
+        hedge_budget: float = 0.1,
+        circuit_failure_threshold: int = 5,
+        circuit_reset_seconds: float = 30.0,
+        section_cache_ttl: float = 300.0,
+        section_suite_fetch_ratio: float = 0.5
+    ):
         """
         Initialize the TestRail API client.
         
@@ -15,6 +64,16 @@ class TestRailClient:
             base_url: The URL of your TestRail instance (e.g., [https://example.testrail.io/)](https://example.testrail.io/))
             username: Your TestRail username/email
             api_key: Your TestRail API key
+            timeout: Request timeout in seconds (None waits indefinitely)
+            hedge_gets: Send a duplicate GET when the first one is slower than the hedge delay
+            hedge_percentile: Latency percentile of recent GETs of the same API method used as the hedge delay
+            hedge_min_delay: Lower bound for the hedge delay in seconds
+            hedge_budget: Maximum share of GET requests that may be hedged
+            circuit_failure_threshold: Consecutive failures that open the circuit breaker (0 disables it)
+            circuit_reset_seconds: How long the circuit stays open before TestRail is tried again
+            section_cache_ttl: Seconds a cached section tree is used before it is rebuilt
+            section_suite_fetch_ratio: Share of a suite's sections above which a
+                subtree's cases are fetched with one suite-wide request
         """
         self.username = username
         self.api_key = api_key
@@ -36,6 +95,30 @@ class TestRailClient:
             'Authorization': f'Basic {auth}',
             'Content-Type': 'application/json',
         })
+        
+        # Section tree index per suite ID
+        self._section_trees: Dict[int, SectionTree] = {}
+        self.section_cache_ttl = section_cache_ttl
+        self.section_suite_fetch_ratio = section_suite_fetch_ratio
+        
+        self.timeout = timeout
+        self.hedge_gets = hedge_gets
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_budget = hedge_budget
+        # GET latencies per API method, e.g. get_case or get_cases
+        self.latencies: Dict[str, LatencyTracker] = {}
+        self.get_requests = 0
+        self.circuit_breaker = CircuitBreaker(circuit_failure_threshold, circuit_reset_seconds)
+        self.hedged_requests = 0
+        self.hedge_wins = 0
+        self.hedges_skipped = 0
+        self._hedge_in_flight = 0
+        self._hedge_lock = threading.Lock()
+        self._hedge_executor = (
+            ThreadPoolExecutor(max_workers=HEDGE_POOL_SIZE, thread_name_prefix='testrail-hedge')
+            if hedge_gets else None
+        )
 
     def _send_request(self, method: str, uri: str, data: Optional[Dict] = None) -> Any:
         """
@@ -50,30 +133,284 @@ class TestRailClient:
             Response data from TestRail
             
         Raises:
+            CircuitOpenError: If TestRail is considered down after repeated failures
+            TestRailAPIError: If TestRail returns an error status
             Exception: If the request fails
         """
         url = self.base_url + uri
+        method = method.upper()
+        if method not in ('GET', 'POST', 'PUT', 'DELETE'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        body = json.dumps(data) if data else None
         
-        if method.upper() == 'GET':
-            response = self.session.get(url)
-        elif method.upper() == 'POST':
-            response = self.session.post(url, data=json.dumps(data) if data else None)
-        elif method.upper() == 'PUT':
-            response = self.session.put(url, data=json.dumps(data) if data else None)
-        elif method.upper() == 'DELETE':
-            response = self.session.delete(url)
+        is_trial = self.circuit_breaker.before_request()
+        try:
+            if method == 'GET':
+                response = self._get(url, _api_method(uri))
+            elif method == 'POST':
+                response = self.session.post(url, data=body, timeout=self.timeout)
+            elif method == 'PUT':
+                response = self.session.put(url, data=body, timeout=self.timeout)
+            else:
+                response = self.session.delete(url, timeout=self.timeout)
+        except requests.RequestException:
+            self.circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            # Not a sign of TestRail's health, but must not keep the half-open trial slot
+            if is_trial:
+                self.circuit_breaker.release_trial()
+            raise
+        
+        # Server errors and throttling count against TestRail's health, client errors do not
+        if response.status_code >= 500 or response.status_code == 429:
+            self.circuit_breaker.record_failure()
         else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+            self.circuit_breaker.record_success()
             
         if response.status_code >= 300:
             try:
                 error = response.json()
             except:
                 error = response.text
-            raise Exception(f"TestRail API returned HTTP {response.status_code}: {error}")
+            try:
+                retry_after = float(response.headers.get('Retry-After'))
+            except (TypeError, ValueError):
+                retry_after = None
+            raise TestRailAPIError(response.status_code, error, retry_after)
             
         return response.json() if response.content else {}
 
+    def _timed_get(self, url: str) -> Tuple[requests.Response, float]:
+        """Send a GET request and return the response with its latency in seconds."""
+        start = time.monotonic()
+        response = self.session.get(url, timeout=self.timeout)
+        return response, time.monotonic() - start
+
+    def _record_latency(self, api_method: str, response: requests.Response, seconds: float) -> None:
+        """Record the latency of a GET request that TestRail answered without a server error."""
+        if response.status_code >= 500:
+            return
+        with self._hedge_lock:
+            tracker = self.latencies.get(api_method)
+            if tracker is None:
+                tracker = self.latencies[api_method] = LatencyTracker()
+        tracker.record(seconds)
+
+    def _hedge_delay(self, api_method: str) -> Optional[float]:
+        """Get the hedge delay for an API method, or None while it has too few samples."""
+        tracker = self.latencies.get(api_method)
+        if tracker is None:
+            return None
+        delay = tracker.percentile(self.hedge_percentile)
+        return None if delay is None else max(delay, self.hedge_min_delay)
+
+    def _submit_get(self, url: str) -> Optional[Future]:
+        """Run a GET request on the hedging pool, or return None if no worker is free."""
+        with self._hedge_lock:
+            if self._hedge_in_flight >= HEDGE_POOL_SIZE:
+                return None
+            self._hedge_in_flight += 1
+        try:
+            return self._hedge_executor.submit(self._pooled_get, url)
+        except BaseException:
+            self._finish_pooled_get()
+            raise
+
+    def _pooled_get(self, url: str) -> Tuple[requests.Response, float]:
+        """Send a GET request on the hedging pool, freeing its slot when done."""
+        try:
+            return self._timed_get(url)
+        finally:
+            self._finish_pooled_get()
+
+    def _finish_pooled_get(self) -> None:
+        """Free a slot on the hedging pool."""
+        with self._hedge_lock:
+            self._hedge_in_flight -= 1
+
+    def _count(self, counter: str) -> None:
+        """Increment a hedging counter."""
+        with self._hedge_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _take_hedge_budget(self) -> bool:
+        """Count a hedge if it stays within the share of GET requests allowed to be hedged."""
+        with self._hedge_lock:
+            if self.hedged_requests + 1 > self.hedge_budget * self.get_requests:
+                return False
+            self.hedged_requests += 1
+            return True
+
+    def _get(self, url: str, api_method: str) -> requests.Response:
+        """
+        Send a GET request, hedged when enabled.
+        
+        When the request has not completed within the hedge delay (a percentile
+        of recent latencies of the same API method), a duplicate is sent and the
+        first response wins. The slower request cannot be interrupted; its
+        response is discarded and it keeps its pool worker until it finishes or
+        times out. Requests are not hedged while all pool workers are busy or
+        the hedge budget is used up.
+        """
+        self._count('get_requests')
+        delay = self._hedge_delay(api_method) if self.hedge_gets else None
+        if delay is None:
+            response, seconds = self._timed_get(url)
+            self._record_latency(api_method, response, seconds)
+            return response
+        
+        primary = self._submit_get(url)
+        if primary is None:
+            self._count('hedges_skipped')
+            response, seconds = self._timed_get(url)
+            self._record_latency(api_method, response, seconds)
+            return response
+        done, _ = wait([primary], timeout=delay)
+        
+        hedge = None
+        if not done:
+            if not self._take_hedge_budget():
+                self._count('hedges_skipped')
+            else:
+                hedge = self._submit_get(url)
+                if hedge is None:
+                    with self._hedge_lock:
+                        self.hedged_requests -= 1
+                        self.hedges_skipped += 1
+        if hedge is None:
+            response, seconds = primary.result()
+            self._record_latency(api_method, response, seconds)
+            return response
+        
+        done, _ = wait([primary, hedge], return_when=FIRST_COMPLETED)
+        winner = hedge if hedge in done else primary
+        other = primary if winner is hedge else hedge
+        if winner.exception() is not None:
+            # Fall back to the other request before giving up
+            winner, other = other, winner
+            winner.result()
+        if other.cancel():
+            self._finish_pooled_get()
+        if winner is hedge:
+            self._count('hedge_wins')
+        response, seconds = winner.result()
+        self._record_latency(api_method, response, seconds)
+        return response
+
+    def get_metrics(self) -> Dict:
+        """Get request latency, hedging and circuit breaker metrics."""
+        with self._hedge_lock:
+            latencies = dict(self.latencies)
+            counters = {
+                'get_requests': self.get_requests,
+                'hedged_requests': self.hedged_requests,
+                'hedge_wins': self.hedge_wins,
+                'hedges_skipped': self.hedges_skipped,
+            }
+        return {
+            'latency_ms': {
+                api_method: {
+                    'p50': _to_ms(tracker.percentile(50)),
+                    'p95': _to_ms(tracker.percentile(95)),
+                }
+                for api_method, tracker in sorted(latencies.items())
+            },
+            'hedging_enabled': self.hedge_gets,
+            **counters,
+            'circuit_breaker': self.circuit_breaker.metrics(),
+        }
+
+    def _get_paginated(self, uri: str, key: str) -> List[Dict]:
+        """
+        Send a GET request and follow TestRail's pagination links.
+        
+        Args:
+            uri: API endpoint URI
+            key: The key holding the items in a paginated response
+            
+        Returns:
+            All items across pages
+        """
+        items = []
+        while uri:
+            response = self._send_request('GET', uri)
+            if isinstance(response, list):
+                return items + response
+            items.extend(response.get(key, []))
+            next_link = (response.get('_links') or {}).get('next')
+            uri = next_link.split('/api/v2/', 1)[-1] if next_link else None
+        return items
+
+    def _send_bulk_request(
+        self,
+        uri: str,
+        case_ids: List[int],
+        data: Optional[Dict] = None,
+        chunk_size: int = BULK_CHUNK_SIZE
+    ) -> List[Dict]:
+        """
+        Send a bulk request in chunks of case IDs.
+        
+        Args:
+            uri: API endpoint URI
+            case_ids: The IDs of the cases to include
+            data: Additional request data sent with every chunk
+            chunk_size: Maximum number of case IDs per request
+            
+        Chunks throttled with HTTP 429 are retried after the Retry-After delay.
+        Once the circuit breaker opens, the remaining chunks are not attempted.
+            
+        Returns:
+            One outcome per chunk with its status ('succeeded', 'failed' or
+            'not_attempted') and case count. Successful chunks give their first
+            and last case ID, the others all case IDs and the error message.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        outcomes = []
+        for start in range(0, len(case_ids), chunk_size):
+            chunk = case_ids[start:start + chunk_size]
+            payload = dict(data or {})
+            payload['case_ids'] = chunk
+            try:
+                self._send_bulk_chunk(uri, payload)
+            except CircuitOpenError as e:
+                remaining = case_ids[start:]
+                outcomes.append({
+                    'status': 'not_attempted',
+                    'case_count': len(remaining),
+                    'case_ids': remaining,
+                    'error': str(e),
+                })
+                break
+            except Exception as e:
+                outcomes.append({
+                    'status': 'failed',
+                    'case_count': len(chunk),
+                    'case_ids': chunk,
+                    'error': str(e),
+                })
+            else:
+                outcomes.append({
+                    'status': 'succeeded',
+                    'case_count': len(chunk),
+                    'first_case_id': chunk[0],
+                    'last_case_id': chunk[-1],
+                })
+        return outcomes
+
+    def _send_bulk_chunk(self, uri: str, payload: Dict) -> Any:
+        """Send one bulk chunk, retrying while TestRail throttles it with HTTP 429."""
+        for attempt in range(BULK_MAX_RETRIES + 1):
+            try:
+                return self._send_request('POST', uri, payload)
+            except TestRailAPIError as e:
+                if e.status_code != 429 or attempt == BULK_MAX_RETRIES:
+                    raise
+                delay = e.retry_after if e.retry_after is not None else BULK_RETRY_DELAY
+                time.sleep(min(delay, BULK_MAX_RETRY_DELAY))
+
     # Cases API
     def get_case(self, case_id: int) -> Dict:
         """Get a test case by ID."""
@@ -98,6 +435,110 @@ class TestRailClient:
         """Delete a test case."""
         return self._send_request('POST', f'delete_case/{case_id}')
     
+    def update_cases(
+        self,
+        suite_id: int,
+        case_ids: List[int],
+        data: Dict,
+        chunk_size: int = BULK_CHUNK_SIZE
+    ) -> List[Dict]:
+        """Update multiple test cases of a suite with the same values."""
+        if not data:
+            raise ValueError("At least one field to update is required")
+        return self._send_bulk_request(f'update_cases/{suite_id}', case_ids, data, chunk_size)
+    
+    def delete_cases(
+        self,
+        suite_id: int,
+        case_ids: List[int],
+        chunk_size: int = BULK_CHUNK_SIZE
+    ) -> List[Dict]:
+        """Delete multiple test cases of a suite."""
+        return self._send_bulk_request(f'delete_cases/{suite_id}', case_ids, chunk_size=chunk_size)
+    
+    def get_cases_in_section(
+        self,
+        project_id: int,
+        section_id: int,
+        recursive: bool = True,
+        refresh: bool = False
+    ) -> List[Dict]:
+        """
+        Get the test cases of a section and, optionally, its subsections.
+        
+        Cases are fetched section by section in tree order, unless the subtree
+        covers more than section_suite_fetch_ratio of the suite's sections;
+        then a single suite-wide request is filtered locally.
+        """
+        if not recursive:
+            tree = None if refresh else self._find_section_tree(section_id)
+            suite_id = tree.suite_id if tree else self.get_section(section_id)['suite_id']
+            return self._get_paginated(
+                f'get_cases/{project_id}&suite_id={suite_id}&section_id={section_id}', 'cases'
+            )
+        
+        tree = self.get_section_tree(project_id, section_id=section_id, refresh=refresh)
+        section_ids = tree.subtree(section_id)
+        if len(section_ids) > self.section_suite_fetch_ratio * len(tree.sections):
+            cases = self._get_paginated(f'get_cases/{project_id}&suite_id={tree.suite_id}', 'cases')
+            return [case for case in cases if case.get('section_id') in section_ids]
+        cases = []
+        for sid in tree.ordered_subtree(section_id):
+            cases.extend(self._get_paginated(
+                f'get_cases/{project_id}&suite_id={tree.suite_id}&section_id={sid}', 'cases'
+            ))
+        return cases
+    
+    # Sections API
+    def get_section(self, section_id: int) -> Dict:
+        """Get a section by ID."""
+        return self._send_request('GET', f'get_section/{section_id}')
+    
+    def get_sections(self, project_id: int, suite_id: Optional[int] = None) -> List[Dict]:
+        """Get all sections for a project/suite."""
+        uri = f'get_sections/{project_id}'
+        if suite_id:
+            uri += f'&suite_id={suite_id}'
+        return self._get_paginated(uri, 'sections')
+    
+    def get_section_tree(
+        self,
+        project_id: int,
+        suite_id: Optional[int] = None,
+        section_id: Optional[int] = None,
+        refresh: bool = False
+    ) -> SectionTree:
+        """
+        Get the cached section tree of a suite, building it on first use.
+        
+        The suite is given directly or resolved from one of its sections.
+        Trees older than the section cache TTL are rebuilt.
+        """
+        if suite_id is None:
+            if section_id is None:
+                raise ValueError("Either suite_id or section_id is required")
+            tree = None if refresh else self._find_section_tree(section_id)
+            if tree is not None:
+                return tree
+            suite_id = self.get_section(section_id)['suite_id']
+        tree = self._section_trees.get(suite_id)
+        if (refresh or tree is None or self._section_tree_expired(tree)
+                or (section_id is not None and section_id not in tree)):
+            sections = self.get_sections(project_id, suite_id)
+            self._section_trees[suite_id] = SectionTree(suite_id, sections)
+        return self._section_trees[suite_id]
+    
+    def _find_section_tree(self, section_id: int) -> Optional[SectionTree]:
+        """Find an unexpired cached section tree containing the given section."""
+        for tree in self._section_trees.values():
+            if section_id in tree and not self._section_tree_expired(tree):
+                return tree
+        return None
+    
+    def _section_tree_expired(self, tree: SectionTree) -> bool:
+        """Check whether a cached section tree is older than the section cache TTL."""
+        return time.monotonic() - tree.built_at > self.section_cache_ttl
+    
     # Projects API
     def get_project(self, project_id: int) -> Dict:
         """Get a project by ID."""